@@ -0,0 +1,38 @@
+"""
+File:  __init__.py
+Created By:  Nimisha Thekkarath(nimisha0092@gmail.com)
+
+.. note:: The public names are imported from their submodules on first access, so
+    importing the package itself is cheap and free of side effects.
+"""
+import importlib
+
+_submodule_by_name = {
+    'TickerSymbol': 'enums',
+    'BuySellIndicator': 'enums',
+    'Trade': 'trade',
+    'Stock': 'stock',
+    'CommonStock': 'stock',
+    'PreferredStock': 'stock',
+    'GlobalBeverageCorporationExchange': 'exchange',
+    'configure_logging': 'logs',
+    'LOG_FORMAT': 'logs',
+}
+
+__all__ = list(_submodule_by_name)
+
+
+def __getattr__(name: str):
+    try:
+        submodule_name = _submodule_by_name[name]
+    except KeyError:
+        msg = "module {module!r} has no attribute {name!r}".format(module=__name__,
+                                                                    name=name)
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module('.' + submodule_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,26 @@
+"""
+File:  enums.py
+Created By:  Nimisha Thekkarath(nimisha0092@gmail.com)
+"""
+import enum
+
+
+@enum.unique
+class TickerSymbol(enum.Enum):
+
+    """Unique identifier for one of the traded stocks"""
+
+    TEA = 1
+    POP = 2
+    ALE = 3
+    GIN = 4
+    JOE = 5
+
+
+@enum.unique
+class BuySellIndicator(enum.Enum):
+
+    """Indicator to buy or sell that accompanies each trade"""
+
+    BUY = 1
+    SELL = 2
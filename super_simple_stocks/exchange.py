@@ -0,0 +1,59 @@
+"""
+File:  exchange.py
+Created By:  Nimisha Thekkarath(nimisha0092@gmail.com)
+"""
+import operator
+import logging
+
+from datetime import datetime
+from functools import reduce
+
+from .stock import Stock
+from .trade import Trade
+
+logger = logging.getLogger(__name__)
+
+
+class GlobalBeverageCorporationExchange:
+
+    """The whole exchange where the trades take place"""
+
+    def __init__(self,
+                 stocks: list[Stock]):
+        """
+        :param stocks: The stocks traded at this exchange.
+        :raise ValueError:
+        """
+        logger.info("GlobalBeverageCorporationExchange")
+        if len(stocks) > 0:
+            self.stocks = stocks
+        else:
+            msg = "Argument stocks={stocks} should be a non empty sequence.".format(stocks=stocks)
+            raise ValueError(msg)
+
+    def record_trade(self,
+                     trade: Trade):
+        """Records a trade for the proper stock.
+        :param trade: The trade to record.
+        """
+        logger.info("Records a trade for the proper stock")
+        stock = next(stock for stock in self.stocks
+                     if stock.ticker_symbol is trade.ticker_symbol)
+        stock.record_trade(trade)
+
+    def geometric_mean(self,
+                        current_time: datetime=datetime.now()) -> float:
+        """
+        :param current_time: The point of time for which we want to obtain the index.
+        :return: The geometric mean of all stock prices. Returns None if any of them is
+            None.
+        """
+        logger.info("Finding The geometric mean of all stock prices")
+        n = len(self.stocks)
+        stock_prices = [stock.price(current_time) for stock in self.stocks]
+
+        if None in stock_prices:
+            return None
+        else:
+            product = reduce(operator.mul, stock_prices, 1)
+            return product**(1/n)
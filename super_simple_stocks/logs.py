@@ -0,0 +1,32 @@
+"""
+File:  logs.py
+Created By:  Nimisha Thekkarath(nimisha0092@gmail.com)
+"""
+import logging
+import os
+
+LOG_FORMAT = "%(levelname)s %(asctime)s - %(message)s"
+
+
+def configure_logging(filename: str='super_simple_stockers.log',
+                      level: int=logging.DEBUG) -> logging.Logger:
+    """Sends the log records of this package to a file.
+    :param filename: The file the log records are written to. It is truncated first.
+    :param level: The lowest level of the records to be written
+    :return: The logger of this package
+    .. note:: Importing the package no longer configures logging by itself, so that
+        short-lived processes do not pay for opening the log file. Applications that
+        want the previous behaviour call this function once at start up. Further calls
+        for the same file leave the existing handler in place.
+    """
+    logger = logging.getLogger(__package__)
+    logger.setLevel(level)
+    for handler in logger.handlers:
+        if (isinstance(handler, logging.FileHandler)
+                and handler.baseFilename == os.path.abspath(filename)):
+            return logger
+
+    handler = logging.FileHandler(filename, mode='w')
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logger.addHandler(handler)
+    return logger
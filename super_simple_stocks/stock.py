@@ -1,84 +1,16 @@
 """
-File:  super_simple_stockes.py
+File:  stock.py
 Created By:  Nimisha Thekkarath(nimisha0092@gmail.com)
 """
-import enum
 import abc
-import operator
 import logging
 
 from datetime import datetime, timedelta
-from functools import reduce
 
-LOG_FORMAT = "%(levelname)s %(asctime)s - %(message)s"
-logging.basicConfig(filename='super_simple_stockers.log',
-                    level = logging.DEBUG,
-                    format = LOG_FORMAT,
-                    filemode = 'w' )
-logger = logging.getLogger() 
+from .enums import TickerSymbol
+from .trade import Trade
 
-@enum.unique
-class TickerSymbol(enum.Enum):
-
-    """Unique identifier for one of the traded stocks"""
-
-    TEA = 1
-    POP = 2
-    ALE = 3
-    GIN = 4
-    JOE = 5
-
-
-@enum.unique
-class BuySellIndicator(enum.Enum):
-
-    """Indicator to buy or sell that accompanies each trade"""
-
-    BUY = 1
-    SELL = 2
-
-
-class Trade:
-
-    """A change of ownership of a collection of shares at a definite price per share"""
-
-    def __init__(self,
-                 ticker_symbol: TickerSymbol,
-                 timestamp: datetime,
-                 quantity: int,
-                 price_per_share: float,
-                 buy_sell_indicator: BuySellIndicator):
-        """
-        :param timestamp: The moment when the transaction has taken place
-        :param quantity: The amount of shares exchanged
-        :param price_per_share: Price for each share
-        :param buy_sell_indicator: Indication to buy or sell
-        """
-       
-        self.ticker_symbol = ticker_symbol
-        self.timestamp = timestamp
-        logger.info("Creating new Trade={}".format(self.ticker_symbol))
-        if quantity > 0:
-            self.quantity = quantity
-        else:
-            msg = "The quantity of shares has to be positive."
-            raise ValueError(msg)
-
-        if price_per_share >= 0.0:
-            self.price_per_share = price_per_share
-        else:
-            msg = "The price per share can not be negative."
-            raise ValueError(msg)
-
-        self.buy_sell_indicator = buy_sell_indicator
-        logger.info("Created Trade: total_price ={}".format(self.total_price))
-
-    @property
-    def total_price(self) -> float:
-        """
-        :return: The total price of the trade
-        """
-        return self.quantity * self.price_per_share
+logger = logging.getLogger(__name__)
 
 
 class Stock(abc.ABC):
@@ -244,49 +176,3 @@ class PreferredStock(Stock):
     def dividend(self):
         logger.info("Calculate dividend for a Preferred Stock") 
         return self.fixed_dividend * self.par_value
-
-
-class GlobalBeverageCorporationExchange:
-
-    """The whole exchange where the trades take place"""
-
-    def __init__(self,
-                 stocks: list[Stock]):
-        """
-        :param stocks: The stocks traded at this exchange.
-        :raise ValueError:
-        """
-        logger.info("GlobalBeverageCorporationExchange")
-        if len(stocks) > 0:
-            self.stocks = stocks
-        else:
-            msg = "Argument stocks={stocks} should be a non empty sequence.".format(stocks=stocks)
-            raise ValueError(msg)
-
-    def record_trade(self,
-                     trade: Trade):
-        """Records a trade for the proper stock.
-        :param trade: The trade to record.
-        """
-        logger.info("Records a trade for the proper stock")
-        stock = next(stock for stock in self.stocks
-                     if stock.ticker_symbol is trade.ticker_symbol)
-        stock.record_trade(trade)
-
-    def geometric_mean(self,
-                        current_time: datetime=datetime.now()) -> float:
-        """
-        :param current_time: The point of time for which we want to obtain the index.
-        :return: The geometric mean of all stock prices. Returns None if any of them is
-            None.
-        """
-        logger.info("Finding The geometric mean of all stock prices")
-        n = len(self.stocks)
-        stock_prices = [stock.price(current_time) for stock in self.stocks]
-
-        if None in stock_prices:
-            return None
-        else:
-            product = reduce(operator.mul, stock_prices, 1)
-            return product**(1/n)
-
@@ -0,0 +1,91 @@
+"""
+File:  trade.py
+Created By:  Nimisha Thekkarath(nimisha0092@gmail.com)
+"""
+import logging
+
+from datetime import datetime
+from typing import Iterable
+
+from .enums import TickerSymbol, BuySellIndicator
+
+logger = logging.getLogger(__name__)
+
+
+class Trade:
+
+    """A change of ownership of a collection of shares at a definite price per share"""
+
+    def __init__(self,
+                 ticker_symbol: TickerSymbol,
+                 timestamp: datetime,
+                 quantity: int,
+                 price_per_share: float,
+                 buy_sell_indicator: BuySellIndicator):
+        """
+        :param timestamp: The moment when the transaction has taken place
+        :param quantity: The amount of shares exchanged
+        :param price_per_share: Price for each share
+        :param buy_sell_indicator: Indication to buy or sell
+        """
+       
+        self.ticker_symbol = ticker_symbol
+        self.timestamp = timestamp
+        logger.info("Creating new Trade={}".format(self.ticker_symbol))
+        if quantity > 0:
+            self.quantity = quantity
+        else:
+            msg = "The quantity of shares has to be positive."
+            raise ValueError(msg)
+
+        if price_per_share >= 0.0:
+            self.price_per_share = price_per_share
+        else:
+            msg = "The price per share can not be negative."
+            raise ValueError(msg)
+
+        self.buy_sell_indicator = buy_sell_indicator
+        logger.info("Created Trade: total_price ={}".format(self.total_price))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> list['Trade']:
+        """Creates trades in bulk from pre-validated rows.
+        :param rows: An iterable of tuples laid out as the arguments of the initializer:
+            (ticker_symbol, timestamp, quantity, price_per_share, buy_sell_indicator)
+        :return: A list with one Trade per row, in the same order
+        :raise ValueError:
+        .. note:: The quantity and price checks of the initializer are done once for the
+            whole batch and a single log record is emitted, so the per-trade cost is
+            reduced to filling in the instance attributes.
+        """
+        rows = list(rows)
+        if len(rows) == 0:
+            return []
+
+        _, _, quantities, prices_per_share, _ = zip(*rows)
+        if not all(quantity > 0 for quantity in quantities):
+            msg = "The quantity of shares has to be positive."
+            raise ValueError(msg)
+        if not all(price_per_share >= 0.0 for price_per_share in prices_per_share):
+            msg = "The price per share can not be negative."
+            raise ValueError(msg)
+
+        logger.info("Creating {} Trades in bulk".format(len(rows)))
+        new = cls.__new__
+        trades = []
+        for ticker_symbol, timestamp, quantity, price_per_share, buy_sell_indicator in rows:
+            trade = new(cls)
+            trade.__dict__ = {'ticker_symbol': ticker_symbol,
+                              'timestamp': timestamp,
+                              'quantity': quantity,
+                              'price_per_share': price_per_share,
+                              'buy_sell_indicator': buy_sell_indicator}
+            trades.append(trade)
+        return trades
+
+    @property
+    def total_price(self) -> float:
+        """
+        :return: The total price of the trade
+        """
+        return self.quantity * self.price_per_share
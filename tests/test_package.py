@@ -0,0 +1,88 @@
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import super_simple_stocks
+
+
+class PackageLazyImportTestCase(unittest.TestCase):
+
+    def test_public_names_are_exported(self):
+        for name in super_simple_stocks.__all__:
+            self.assertTrue(hasattr(super_simple_stocks, name))
+
+    def test_raises_attribute_error_on_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            super_simple_stocks.NotAName
+
+
+class ConfigureLoggingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.log_dir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.log_dir.name, 'super_simple_stockers.log')
+
+    def tearDown(self):
+        logger = logging.getLogger('super_simple_stocks')
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+        logger.setLevel(logging.NOTSET)
+        self.log_dir.cleanup()
+
+    def test_writes_log_records_to_file(self):
+        logger = super_simple_stocks.configure_logging(self.filename)
+        logger.info("Configured")
+        with open(self.filename) as log_file:
+            self.assertIn("INFO", log_file.read())
+
+    def test_is_idempotent(self):
+        super_simple_stocks.configure_logging(self.filename)
+        logger = super_simple_stocks.configure_logging(self.filename)
+        logger.info("Configured")
+        self.assertEqual(len(logger.handlers), 1)
+        with open(self.filename) as log_file:
+            self.assertEqual(log_file.read().count("Configured"), 1)
+
+
+class PackageImportBenchmarkTestCase(unittest.TestCase):
+
+    """Imports the package in a fresh interpreter, as a short-lived process would"""
+
+    import_time_budget = 0.05
+
+    script = ("import sys, time\n"
+              "start = time.perf_counter()\n"
+              "import super_simple_stocks\n"
+              "print(time.perf_counter() - start)\n"
+              "print(' '.join(sorted(name for name in sys.modules\n"
+              "                      if name.startswith('super_simple_stocks.'))))\n")
+
+    def setUp(self):
+        self.cwd = tempfile.TemporaryDirectory()
+        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=project_dir)
+        output = subprocess.run([sys.executable, '-c', self.script],
+                                cwd=self.cwd.name,
+                                env=env,
+                                capture_output=True,
+                                text=True,
+                                check=True).stdout.splitlines()
+        self.import_time = float(output[0])
+        self.imported_submodules = output[1].split()
+
+    def tearDown(self):
+        self.cwd.cleanup()
+
+    def test_import_time_within_budget(self):
+        msg = "import super_simple_stocks: {:.2f} ms".format(self.import_time * 1000)
+        self.assertLess(self.import_time, self.import_time_budget, msg=msg)
+
+    def test_no_submodules_imported(self):
+        self.assertEqual(self.imported_submodules, [])
+
+    def test_no_log_file_created(self):
+        self.assertEqual(os.listdir(self.cwd.name), [])
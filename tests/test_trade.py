@@ -1,4 +1,5 @@
 import unittest
+import timeit
 
 from super_simple_stocks import Trade
 from .factories import TradeFactory
@@ -33,3 +34,68 @@ class TradeTotalPriceTestCase(unittest.TestCase):
         trade = TradeFactory.get_trade()
         expected_value = trade.quantity * trade.price_per_share
         self.assertEqual(trade.total_price, expected_value)
+
+
+class TradeFromRowsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.trades = TradeFactory.get_trades()
+        self.rows = [(trade.ticker_symbol,
+                      trade.timestamp,
+                      trade.quantity,
+                      trade.price_per_share,
+                      trade.buy_sell_indicator) for trade in self.trades]
+
+    def test_matches_initializer(self):
+        bulk_trades = Trade.from_rows(self.rows)
+        self.assertEqual([vars(trade) for trade in bulk_trades],
+                         [vars(trade) for trade in self.trades])
+
+    def test_total_price_value(self):
+        trade = Trade.from_rows(self.rows)[0]
+        expected_value = trade.quantity * trade.price_per_share
+        self.assertEqual(trade.total_price, expected_value)
+
+    def test_empty_rows(self):
+        self.assertEqual(Trade.from_rows([]), [])
+
+    def test_raises_value_error_on_non_positive_qty(self):
+        bad_row = self.rows[0][:2] + (0,) + self.rows[0][3:]
+        with self.assertRaises(ValueError):
+            Trade.from_rows(self.rows + [bad_row])
+
+    def test_raises_value_error_on_negative_price_per_share(self):
+        bad_row = self.rows[0][:3] + (-25.0,) + self.rows[0][4:]
+        with self.assertRaises(ValueError):
+            Trade.from_rows(self.rows + [bad_row])
+
+    def test_raises_value_error_on_nan_price_per_share(self):
+        bad_row = self.rows[0][:3] + (float('nan'),) + self.rows[0][4:]
+        with self.assertRaises(ValueError):
+            Trade(*bad_row)
+        with self.assertRaises(ValueError):
+            Trade.from_rows([bad_row] + self.rows)
+
+
+class TradeConstructionBenchmarkTestCase(unittest.TestCase):
+
+    n = 5000
+    repeat = 5
+
+    def setUp(self):
+        trade = TradeFactory.get_trade()
+        self.rows = [(trade.ticker_symbol,
+                      trade.timestamp,
+                      trade.quantity,
+                      trade.price_per_share,
+                      trade.buy_sell_indicator)] * self.n
+
+    def test_from_rows_outpaces_initializer(self):
+        init_time = min(timeit.repeat(lambda: [Trade(*row) for row in self.rows],
+                                      number=1, repeat=self.repeat))
+        bulk_time = min(timeit.repeat(lambda: Trade.from_rows(self.rows),
+                                      number=1, repeat=self.repeat))
+
+        msg = "Trade(): {:.0f} trades/s, Trade.from_rows: {:.0f} trades/s".format(
+            self.n / init_time, self.n / bulk_time)
+        self.assertLess(bulk_time, init_time, msg=msg)